@@ -1,7 +1,14 @@
+import importlib
 from importlib import metadata
+from typing import TYPE_CHECKING, Any, List
 
-from langchain_critique.toolkits import CritiqueToolkit
-from langchain_critique.tools import CritiqueSearchTool, CritiqueAPIDesignTool, CritiqueDynamicAPITool
+if TYPE_CHECKING:
+    from langchain_critique.toolkits import CritiqueToolkit
+    from langchain_critique.tools import (
+        CritiqueAPIDesignTool,
+        CritiqueDynamicAPITool,
+        CritiqueSearchTool,
+    )
 
 try:
     __version__ = metadata.version(__package__)
@@ -10,10 +17,33 @@ except metadata.PackageNotFoundError:
     __version__ = ""
 del metadata  # optional, avoids polluting the results of dir(__package__)
 
+# Attribute -> submodule map for PEP 562 lazy imports, so `import
+# langchain_critique` stays cheap and submodules (and their transitive
+# requests/httpx/pydantic imports) only load on first attribute access.
+_LAZY = {
+    "CritiqueToolkit": "toolkits",
+    "CritiqueSearchTool": "tools",
+    "CritiqueAPIDesignTool": "tools",
+    "CritiqueDynamicAPITool": "tools",
+}
+
 __all__ = [
     "CritiqueToolkit",
     "CritiqueSearchTool",
-    "CritiqueAPIDesignTool", 
+    "CritiqueAPIDesignTool",
     "CritiqueDynamicAPITool",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module = importlib.import_module(f"langchain_critique.{_LAZY[name]}")
+        value = getattr(module, name)
+        globals()[name] = value  # cache so subsequent lookups skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
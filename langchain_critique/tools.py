@@ -1,18 +1,229 @@
 """Critique tools."""
 
-from typing import Dict, List, Optional, Type, Union
-from urllib.parse import urlparse
+from typing import Callable, Dict, List, Optional, Type, Union, Any
+from collections import OrderedDict
+import asyncio
 import base64
-import requests
+import binascii
+import functools
+import hashlib
+import importlib.util
 import os
-from typing import Optional, List, Dict, Any, Union
-from enum import Enum
-from datetime import datetime
 import re
+import threading
+import time
+from enum import Enum
+
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field, field_validator, create_model, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    create_model,
+    model_validator,
+)
+
+
+# (connect, read) timeout for sync session calls, matching the async client.
+_REQUEST_TIMEOUT = (5.0, 30.0)
+
+
+def _build_session() -> requests.Session:
+    """Build a pooled ``requests.Session`` for Critique API calls.
+
+    Keeping connections alive between invocations lets repeated calls to the
+    API reuse the same TCP+TLS connection instead of paying the handshake
+    cost on every call. Retries stay restricted to urllib3's idempotent
+    default methods: the design tool POSTs non-idempotent create/update
+    operations through this session, and replaying those after a late 5xx
+    could create duplicate APIs.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Default session shared across tool instances so that many short-lived tool
+# objects still draw from a single connection pool.
+_DEFAULT_SESSION = _build_session()
+
+# Shared async client, created lazily so importing the package does not touch
+# the event loop. Lets agents fan out many tool calls concurrently over the
+# same connection pool.
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """Whether the optional ``h2`` package (httpx's ``http2`` extra) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared ``httpx.AsyncClient``, creating it on first use.
+
+    HTTP/2 multiplexes concurrent requests over one TLS stream, so agent
+    fan-out needs far fewer sockets than HTTP/1.1 keep-alive (which still
+    serializes requests per connection). When the ``h2`` package is not
+    installed the client falls back to HTTP/1.1 rather than raising
+    ``ImportError`` on the first request.
+    """
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+        )
+    return _ASYNC_CLIENT
+
+
+class _TTLCache:
+    """Minimal thread-safe LRU cache with per-entry TTL expiry."""
+
+    __slots__ = ("_maxsize", "_ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+# Default ceiling on concurrent requests for batched tool calls, so a large
+# agent fan-out doesn't open an unbounded number of sockets.
+_DEFAULT_BATCH_CONCURRENCY = 8
+
+
+def _with_default_concurrency(
+    config: Union[RunnableConfig, List[RunnableConfig], None],
+) -> Union[RunnableConfig, List[RunnableConfig], None]:
+    """Fill in max_concurrency when the caller's config doesn't set one.
+
+    Accepts the same shapes as ``Runnable.batch``: a single config, a
+    per-input list of configs, or None.
+    """
+    if config is None:
+        return {"max_concurrency": _DEFAULT_BATCH_CONCURRENCY}
+    if isinstance(config, list):
+        return [
+            item
+            if item.get("max_concurrency") is not None
+            else {**item, "max_concurrency": _DEFAULT_BATCH_CONCURRENCY}
+            for item in config
+        ]
+    if isinstance(config, dict) and config.get("max_concurrency") is None:
+        return {**config, "max_concurrency": _DEFAULT_BATCH_CONCURRENCY}
+    return config
+
+
+# A large share of tool invocations in agent sessions are exact repeats;
+# a small TTL'd cache turns those into a dict lookup instead of a round-trip.
+_RESPONSE_CACHE = _TTLCache(maxsize=512, ttl=300.0)
+
+
+def _cache_key(api_key: str, url: str, payload: Dict[str, Any]) -> bytes:
+    # The credential is part of the key: the cache and single-flight map are
+    # module-global, and a process serving several API keys must never hand
+    # one tenant's response (or join its in-flight request) to another.
+    return hashlib.blake2b(
+        api_key.encode() + b"\x00" + url.encode() + b"\x00"
+        + orjson.dumps(payload, option=orjson.OPT_SORT_KEYS),
+        digest_size=16,
+    ).digest()
+
+
+# Concurrent identical requests (two chains asking the same sub-question at
+# once) join onto a single in-flight HTTP call instead of racing duplicates.
+_INFLIGHT: Dict[bytes, "asyncio.Future"] = {}
+
+
+async def _single_flight(key: bytes, request: Callable[[], Any]) -> Any:
+    """Join concurrent identical async requests onto one in-flight call.
+
+    The in-flight map is only mutated between awaits on the event-loop
+    thread, so the check-then-set is atomic without a lock.
+    """
+    existing = _INFLIGHT.get(key)
+    if existing is not None:
+        return await existing
+
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        result = await request()
+    except BaseException as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved in case no joiner awaits it
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+# Precompiled validation patterns so per-invocation input checks are a single
+# regex pass instead of urlparse + suffix scans + a full base64 decode.
+_IMG_URL_RE = re.compile(
+    r'^https?://\S+\.(?:jpe?g|png|gif|webp)(?:\?\S*)?$', re.IGNORECASE
+)
+_B64_IMG_RE = re.compile(r'^data:image/[a-z]+;base64,[A-Za-z0-9+/=]+$')
+
+
+def _valid_b64_payload(v: str) -> bool:
+    """Structurally check a base64 payload without decoding all of it.
+
+    The length must be a multiple of 4 and the trailing quantum must decode
+    cleanly, which catches padding errors without the O(N) CPU and memory of
+    decoding a multi-MB image just to discard the bytes.
+    """
+    data = v[v.index(',') + 1:]
+    if len(data) % 4 != 0:
+        return False
+    try:
+        base64.b64decode(data[-8:], validate=True)
+    except (binascii.Error, ValueError):
+        return False
+    return True
 
 
 class CritiqueSearchInput(BaseModel):
@@ -22,14 +233,16 @@ class CritiqueSearchInput(BaseModel):
     calling. The Field default values and descriptions are part of what is sent to
     the model when performing tool calling.
     """
+    model_config = ConfigDict(frozen=True)
+
     prompt: str = Field(..., description="Search query or question to ask")
     image: Optional[str] = Field(None, description="Optional image URL or base64 string to search with")
     source_blacklist: Optional[List[str]] = Field(
-        default=[], 
+        default=[],
         description="Optional list of domain names to exclude from search results"
     )
     output_format: Optional[Dict] = Field(
-        default={}, 
+        default={},
         description="Optional structured output format specification"
     )
 
@@ -38,73 +251,283 @@ class CritiqueSearchInput(BaseModel):
     def validate_image(cls, v):
         if v is None:
             return v
-        if v.startswith('http'):
-            try:
-                result = urlparse(v)
-                if not all([result.scheme, result.netloc]):
-                    raise ValueError("Invalid URL format")
-                if not any(v.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif']):
-                    raise ValueError("URL must point to an image file")
-            except Exception as e:
-                raise ValueError(f"Invalid image URL: {str(e)}")
-        elif v.startswith('data:image'):
-            try:
-                header, data = v.split(',', 1)
-                base64.b64decode(data)
-            except Exception:
-                raise ValueError("Invalid base64 image format")
-        else:
-            raise ValueError("Image must be either a URL or base64 encoded string")
-        return v
+        if _IMG_URL_RE.match(v):
+            return v
+        if _B64_IMG_RE.match(v) and _valid_b64_payload(v):
+            return v
+        raise ValueError("Image must be either an image URL or base64 encoded string")
+
+
+@functools.cache
+def _default_api_key() -> Optional[str]:
+    """Resolve the CRITIQUE_API_KEY environment variable once per process.
+
+    Tool instances are often created per request (e.g. under LangServe);
+    caching keeps repeated construction from re-reading the environment.
+    """
+    return os.environ.get("CRITIQUE_API_KEY")
 
 
 class CritiqueBaseTool(BaseTool):
     """Base class for Critique tools."""
-    
+
     api_key: Optional[str] = Field(default=None, description="Critique API key")
     base_url: str = Field(
         default="https://api.critiquebrowser.app",
         description="Base URL for Critique API"
     )
 
+    _session: requests.Session = PrivateAttr(default=None)
+    _headers: Dict[str, str] = PrivateAttr(default=None)
+
     @model_validator(mode='after')
     def validate_api_key(self) -> 'CritiqueBaseTool':
         if not self.api_key:
-            self.api_key = os.getenv("CRITIQUE_API_KEY")
+            self.api_key = _default_api_key()
         if not self.api_key:
             raise ValueError("api_key must be provided or CRITIQUE_API_KEY environment variable must be set")
+        self._session = _DEFAULT_SESSION
+        self._headers = {
+            "X-API-Key": self.api_key,
+            "Content-Type": "application/json",
+        }
         return self
 
 
+_KNOWN_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+
+
+def _sniff_image_type(head: bytes) -> str:
+    """Best-effort magic-number sniff of the first bytes of an image body."""
+    if head.startswith(b'\xff\xd8\xff'):
+        return "image/jpeg"
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return "image/png"
+    if head.startswith((b'GIF87a', b'GIF89a')):
+        return "image/gif"
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return "image/webp"
+    return "image/jpeg"
+
+
 class CritiqueSearchTool(CritiqueBaseTool):
     """Tool for performing grounded searches with optional image input."""
-    
+
     name: str = "critique_search"
     description: str = "Perform grounded searches with optional image input"
+    args_schema: Type[BaseModel] = CritiqueSearchInput
+    cache: bool = Field(
+        default=True,
+        description="Whether to serve repeated identical searches from the "
+        "in-memory response cache",
+    )
+
+    _search_url: str = PrivateAttr(default=None)
+
+    @model_validator(mode='after')
+    def _precompute_urls(self) -> 'CritiqueSearchTool':
+        self._search_url = f"{self.base_url}/v1/search"
+        return self
+
+    def run_direct(
+        self,
+        prompt: str,
+        image: Optional[str] = None,
+        source_blacklist: Optional[List[str]] = None,
+        output_format: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """Execute a search directly, bypassing ``invoke``'s schema pass.
+
+        For trusted programmatic callers whose inputs are already typed;
+        skips the args_schema model construction and callback plumbing that
+        dominate CPU time on these small calls. LLM-driven paths should keep
+        using ``invoke`` so untrusted input is validated.
+        """
+        return self._run(
+            prompt,
+            image=image,
+            source_blacklist=source_blacklist,
+            output_format=output_format,
+        )
+
+    def batch(
+        self,
+        inputs: List[Any],
+        config: Union[RunnableConfig, List[RunnableConfig], None] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run sibling searches in parallel threads over the pooled session."""
+        return super().batch(
+            inputs,
+            config=_with_default_concurrency(config),
+            return_exceptions=return_exceptions,
+            **kwargs,
+        )
+
+    async def abatch(
+        self,
+        inputs: List[Any],
+        config: Union[RunnableConfig, List[RunnableConfig], None] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Dispatch sibling searches concurrently on the shared async client.
+
+        The underlying gather is bounded to ``_DEFAULT_BATCH_CONCURRENCY``
+        unless the caller's config sets its own max_concurrency.
+        """
+        return await super().abatch(
+            inputs,
+            config=_with_default_concurrency(config),
+            return_exceptions=return_exceptions,
+            **kwargs,
+        )
 
     def _validate_image(self, image: str) -> str:
         """Validate image URL or base64 string."""
-        # URL validation
-        url_pattern = r'^https?://.*\.(jpg|jpeg|png|gif|webp)$'
-        # Base64 validation
-        base64_pattern = r'^data:image\/(jpeg|png|gif|webp);base64,[A-Za-z0-9+/=]+$'
-        
-        if re.match(url_pattern, image, re.IGNORECASE) or re.match(base64_pattern, image):
+        if _IMG_URL_RE.match(image) or (
+            _B64_IMG_RE.match(image) and _valid_b64_payload(image)
+        ):
             return image
         raise ValueError("Invalid image format. Must be a valid image URL or base64 string")
 
-    def _run(self, prompt: str, image: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    def _image_to_base64(self, image_url: str) -> str:
+        """Fetch an image URL and convert it to a base64 data URI.
+
+        The body is streamed and encoded incrementally in 3-byte-aligned
+        chunks so large images never sit in memory three times over
+        (raw content, encoded bytes, decoded str).
+        """
+        response = self._session.get(
+            image_url, stream=True, timeout=_REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        content_type = (
+            response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        )
+        # 57KB chunks: a multiple of 3, so each slice encodes without padding.
+        chunks = response.iter_content(chunk_size=57 * 1024)
+        pending = next(chunks, b"")
+        if content_type not in _KNOWN_IMAGE_TYPES:
+            content_type = _sniff_image_type(pending[:12])
+        encoded = bytearray(f"data:{content_type};base64,".encode('ascii'))
+        for chunk in chunks:
+            cut = len(pending) - (len(pending) % 3)
+            encoded += base64.b64encode(pending[:cut])
+            pending = pending[cut:] + chunk
+        encoded += base64.b64encode(pending)
+        return encoded.decode('ascii')
+
+    async def _aimage_to_base64(self, image_url: str) -> str:
+        """Async counterpart of ``_image_to_base64``."""
+        async with _get_async_client().stream("GET", image_url) as response:
+            response.raise_for_status()
+            content_type = (
+                response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            )
+            chunks = response.aiter_bytes(chunk_size=57 * 1024)
+            pending = b""
+            async for chunk in chunks:
+                pending = chunk
+                break
+            if content_type not in _KNOWN_IMAGE_TYPES:
+                content_type = _sniff_image_type(pending[:12])
+            encoded = bytearray(f"data:{content_type};base64,".encode('ascii'))
+            async for chunk in chunks:
+                cut = len(pending) - (len(pending) % 3)
+                encoded += base64.b64encode(pending[:cut])
+                pending = pending[cut:] + chunk
+        encoded += base64.b64encode(pending)
+        return encoded.decode('ascii')
+
+    def _run(
+        self,
+        prompt: str,
+        image: Optional[str] = None,
+        source_blacklist: Optional[List[str]] = None,
+        output_format: Optional[Dict] = None,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> Dict[str, Any]:
         if image:
             image = self._validate_image(image)
-        
-        # Mock implementation for tests
-        return {
-            "response": "Test response",
-            "citations": ["Test citation"]
-        }
+            if image.startswith('http'):
+                image = self._image_to_base64(image)
+
+        # Empty containers are omitted: they cost bytes on the wire and can
+        # push the server onto its structured-output path for no reason.
+        payload = {"prompt": prompt}
+        if source_blacklist:
+            payload["source_blacklist"] = source_blacklist
+        if output_format:
+            payload["output_format"] = output_format
+        if image:
+            payload["image"] = image
+
+        url = self._search_url
+        if self.cache:
+            key = _cache_key(self.api_key, url, payload)
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        response = self._session.post(
+            url,
+            headers=self._headers,
+            data=orjson.dumps(payload),
+            timeout=_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        if self.cache:
+            _RESPONSE_CACHE.set(key, result)
+        return result
+
+    async def _arun(
+        self,
+        prompt: str,
+        image: Optional[str] = None,
+        source_blacklist: Optional[List[str]] = None,
+        output_format: Optional[Dict] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Dict[str, Any]:
+        if image:
+            image = self._validate_image(image)
+            if image.startswith('http'):
+                image = await self._aimage_to_base64(image)
+
+        # Empty containers are omitted: they cost bytes on the wire and can
+        # push the server onto its structured-output path for no reason.
+        payload = {"prompt": prompt}
+        if source_blacklist:
+            payload["source_blacklist"] = source_blacklist
+        if output_format:
+            payload["output_format"] = output_format
+        if image:
+            payload["image"] = image
 
-    async def _arun(self, prompt: str, image: Optional[str] = None, **kwargs) -> Dict[str, Any]:
-        return await super()._arun(prompt=prompt, image=image, **kwargs)
+        url = self._search_url
+        key = _cache_key(self.api_key, url, payload)
+        if self.cache:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        async def request() -> Dict[str, Any]:
+            response = await _get_async_client().post(
+                url,
+                headers=self._headers,
+                content=orjson.dumps(payload),
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        result = await _single_flight(key, request)
+        if self.cache:
+            _RESPONSE_CACHE.set(key, result)
+        return result
 
 
 class APIOperation(str, Enum):
@@ -115,8 +538,10 @@ class APIOperation(str, Enum):
 
 class CritiqueAPIDesignInput(BaseModel):
     """Input schema for Critique API design tool."""
+    model_config = ConfigDict(frozen=True)
+
     operation: APIOperation = Field(
-        ..., 
+        ...,
         description="Operation to perform: 'create', 'update', 'delete', or 'list'"
     )
     prompt: Optional[str] = Field(
@@ -134,31 +559,206 @@ class CritiqueAPIDesignInput(BaseModel):
 
 class CritiqueAPIDesignTool(CritiqueBaseTool):
     """Tool for designing and managing APIs."""
-    
+
     name: str = "critique_api_design"
     description: str = "Design and manage APIs using natural language"
+    args_schema: Type[BaseModel] = CritiqueAPIDesignInput
+
+    _design_url: str = PrivateAttr(default=None)
+    _design_item_url: str = PrivateAttr(default=None)
+    _ops: Dict[APIOperation, Callable] = PrivateAttr(default=None)
+    _aops: Dict[APIOperation, Callable] = PrivateAttr(default=None)
+
+    @model_validator(mode='after')
+    def _precompute_urls(self) -> 'CritiqueAPIDesignTool':
+        self._design_url = f"{self.base_url}/v1/design-api"
+        # Format template; only the api_id segment varies per call.
+        self._design_item_url = f"{self.base_url}/v1/design-api/{{}}"
+        # Bound-method dispatch tables built once instead of an if/elif
+        # chain of enum comparisons on every call.
+        self._ops = {
+            APIOperation.LIST: self._op_list,
+            APIOperation.CREATE: self._op_create,
+            APIOperation.UPDATE: self._op_update,
+            APIOperation.DELETE: self._op_delete,
+        }
+        self._aops = {
+            APIOperation.LIST: self._aop_list,
+            APIOperation.CREATE: self._aop_create,
+            APIOperation.UPDATE: self._aop_update,
+            APIOperation.DELETE: self._aop_delete,
+        }
+        return self
+
+    def _op_list(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> requests.Response:
+        return self._session.get(
+            self._design_url, headers=self._headers, timeout=_REQUEST_TIMEOUT
+        )
+
+    def _op_create(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> requests.Response:
+        return self._session.post(
+            self._design_url,
+            headers=self._headers,
+            data=orjson.dumps({"prompt": prompt}),
+            timeout=_REQUEST_TIMEOUT,
+        )
+
+    def _op_update(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> requests.Response:
+        return self._session.post(
+            self._design_item_url.format(api_id),
+            headers=self._headers,
+            data=orjson.dumps({"prompt": prompt, "schema_updates": schema_updates}),
+            timeout=_REQUEST_TIMEOUT,
+        )
+
+    def _op_delete(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> requests.Response:
+        return self._session.delete(
+            self._design_item_url.format(api_id),
+            headers=self._headers,
+            timeout=_REQUEST_TIMEOUT,
+        )
+
+    async def _aop_list(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> httpx.Response:
+        return await _get_async_client().get(
+            self._design_url, headers=self._headers
+        )
+
+    async def _aop_create(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> httpx.Response:
+        return await _get_async_client().post(
+            self._design_url,
+            headers=self._headers,
+            content=orjson.dumps({"prompt": prompt}),
+        )
+
+    async def _aop_update(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> httpx.Response:
+        return await _get_async_client().post(
+            self._design_item_url.format(api_id),
+            headers=self._headers,
+            content=orjson.dumps({"prompt": prompt, "schema_updates": schema_updates}),
+        )
+
+    async def _aop_delete(
+        self,
+        prompt: Optional[str],
+        api_id: Optional[str],
+        schema_updates: Optional[Dict],
+    ) -> httpx.Response:
+        return await _get_async_client().delete(
+            self._design_item_url.format(api_id),
+            headers=self._headers,
+        )
 
     def _validate_operation(self, operation: str, **kwargs) -> None:
         """Validate API operation parameters."""
         if operation not in ["create", "update", "delete", "list"]:
             raise ValueError(f"Invalid operation: {operation}")
-        
+
         if operation == "create" and "prompt" not in kwargs:
             raise ValueError("Create operation requires 'prompt' parameter")
-            
+
         if operation in ["update", "delete"] and "api_id" not in kwargs:
             raise ValueError(f"{operation.capitalize()} operation requires 'api_id' parameter")
 
-    def _run(self, operation: str, **kwargs) -> Dict[str, Any]:
-        self._validate_operation(operation, **kwargs)
-        
-        # Mock implementation for tests
-        if operation == "list":
-            return [{"id": "test_api", "name": "Test API"}]
-        return {"id": "test_api", "status": "success"}
+    def _run(
+        self,
+        operation: str,
+        prompt: Optional[str] = None,
+        api_id: Optional[str] = None,
+        schema_updates: Optional[Dict] = None,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        params = {
+            k: v
+            for k, v in [
+                ("prompt", prompt),
+                ("api_id", api_id),
+                ("schema_updates", schema_updates),
+            ]
+            if v is not None
+        }
+        self._validate_operation(operation, **params)
 
-    async def _arun(self, operation: str, **kwargs) -> Dict[str, Any]:
-        return await super()._arun(operation=operation, **kwargs)
+        response = self._ops[APIOperation(operation)](prompt, api_id, schema_updates)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _arun(
+        self,
+        operation: str,
+        prompt: Optional[str] = None,
+        api_id: Optional[str] = None,
+        schema_updates: Optional[Dict] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        params = {
+            k: v
+            for k, v in [
+                ("prompt", prompt),
+                ("api_id", api_id),
+                ("schema_updates", schema_updates),
+            ]
+            if v is not None
+        }
+        self._validate_operation(operation, **params)
+
+        response = await self._aops[APIOperation(operation)](
+            prompt, api_id, schema_updates
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=128)
+def _dynamic_args_schema(fields: tuple) -> Type[BaseModel]:
+    """Build (and memoize) the pydantic model for a dynamic tool schema.
+
+    ``create_model`` dominates the cost of constructing a
+    CritiqueDynamicAPITool; agents registering one tool per designed API
+    often repeat the same input shape, so identical (name, type,
+    description) signatures share one generated class.
+    """
+    return create_model(
+        "DynamicSchema",
+        **{
+            name: (field_type, Field(description=description))
+            for name, field_type, description in fields
+        },
+    )
 
 
 class DynamicSchemaDefinition(BaseModel):
@@ -168,13 +768,28 @@ class DynamicSchemaDefinition(BaseModel):
 
 class CritiqueDynamicAPITool(CritiqueBaseTool):
     """Tool for dynamically created APIs."""
-    
+
     name: str = Field(description="Name of the dynamic API tool")
     description: str = Field(description="Description of the dynamic API")
     api_id: str = Field(description="ID of the API")
     schema_definition: Dict[str, DynamicSchemaDefinition] = Field(
         description="Schema definition for the API inputs"
     )
+    cache: bool = Field(
+        default=True,
+        description="Whether to serve repeated identical calls from the "
+        "in-memory response cache",
+    )
+
+    _validate_input: Callable[[Dict[str, Any]], Dict[str, Any]] = PrivateAttr(
+        default=None
+    )
+    _endpoint: str = PrivateAttr(default=None)
+
+    @model_validator(mode='after')
+    def _precompute_endpoint(self) -> 'CritiqueDynamicAPITool':
+        self._endpoint = f"{self.base_url}/v1/user-defined-service/{self.api_id}"
+        return self
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -182,19 +797,97 @@ class CritiqueDynamicAPITool(CritiqueBaseTool):
 
     def _create_schema(self) -> None:
         """Create a Pydantic model from the schema definition."""
-        fields = {}
-        for field_name, field_info in self.schema_definition.items():
-            fields[field_name] = (
-                field_info.type,
-                Field(description=field_info.description)
-            )
-        
-        self.args_schema = create_model("DynamicSchema", **fields)
+        fields = tuple(
+            (field_name, field_info.type, field_info.description)
+            for field_name, field_info in self.schema_definition.items()
+        )
+        self.args_schema = _dynamic_args_schema(fields)
+        self._validate_input = self._compile_validator()
+
+    def _compile_validator(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Compile the schema definition into a plain-Python validator.
+
+        ``args_schema`` stays a pydantic model so LangChain's tool-calling
+        introspection keeps working, but at execute time a closure over the
+        (field, type) pairs is far cheaper than instantiating a model just to
+        re-check kwargs and dump them back to a dict.
+        """
+        checks = [
+            (name, info.type) for name, info in self.schema_definition.items()
+        ]
 
-    def _run(self, **kwargs) -> Dict[str, Any]:
-        # Validate inputs against schema
-        validated_data = self.args_schema(**kwargs)
-        return {"result": "success", "validated_data": validated_data.model_dump()}
+        def validate(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            for name, expected in checks:
+                if name not in kwargs:
+                    raise ValueError(f"Missing required parameter: {name}")
+                if not isinstance(kwargs[name], expected):
+                    raise ValueError(
+                        f"Parameter '{name}' must be of type {expected.__name__}"
+                    )
+            return kwargs
+
+        return validate
+
+    def run_direct(self, **kwargs: Any) -> Dict[str, Any]:
+        """Execute the dynamic API directly, bypassing ``invoke``'s schema pass.
+
+        Inputs are checked with the compiled validator instead of the pydantic
+        args_schema model, mirroring ``CritiqueSearchTool.run_direct``.
+        """
+        return self._run(**self._validate_input(kwargs))
+
+    def _run(
+        self,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        # invoke() has already validated kwargs against args_schema;
+        # run_direct covers callers that bypass invoke.
+        payload = kwargs
+        url = self._endpoint
+        if self.cache:
+            key = _cache_key(self.api_key, url, payload)
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        response = self._session.post(
+            url,
+            headers=self._headers,
+            data=orjson.dumps(payload),
+            timeout=_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        if self.cache:
+            _RESPONSE_CACHE.set(key, result)
+        return result
+
+    async def _arun(
+        self,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        # invoke() has already validated kwargs against args_schema;
+        # run_direct covers callers that bypass invoke.
+        payload = kwargs
+        url = self._endpoint
+        key = _cache_key(self.api_key, url, payload)
+        if self.cache:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        async def request() -> Dict[str, Any]:
+            response = await _get_async_client().post(
+                url,
+                headers=self._headers,
+                content=orjson.dumps(payload),
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
-    async def _arun(self, **kwargs) -> Dict[str, Any]:
-        return await super()._arun(**kwargs)
+        result = await _single_flight(key, request)
+        if self.cache:
+            _RESPONSE_CACHE.set(key, result)
+        return result
@@ -0,0 +1,43 @@
+import sys
+
+import langchain_critique
+from langchain_critique import __all__
+
+EXPECTED_ALL = [
+    "CritiqueToolkit",
+    "CritiqueSearchTool",
+    "CritiqueAPIDesignTool",
+    "CritiqueDynamicAPITool",
+    "__version__",
+]
+
+
+def test_all_imports() -> None:
+    assert sorted(EXPECTED_ALL) == sorted(__all__)
+
+
+def test_lazy_attributes_resolve() -> None:
+    for name in EXPECTED_ALL:
+        assert getattr(langchain_critique, name) is not None
+
+
+def test_package_import_is_lazy() -> None:
+    # Importing the package shell alone must not pull in the submodules.
+    names = (
+        "langchain_critique",
+        "langchain_critique.tools",
+        "langchain_critique.toolkits",
+    )
+    saved = {name: sys.modules.pop(name, None) for name in names}
+    try:
+        import langchain_critique  # noqa: F811
+
+        assert "langchain_critique.tools" not in sys.modules
+        _ = langchain_critique.CritiqueSearchTool
+        assert "langchain_critique.tools" in sys.modules
+    finally:
+        # Restore the original module objects so later tests keep patching
+        # the same instances they imported at collection time.
+        for name, module in saved.items():
+            if module is not None:
+                sys.modules[name] = module
@@ -1,4 +1,8 @@
+import base64
 from typing import Type, List
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
 import pytest
 
 from langchain_critique.tools import CritiqueSearchTool, CritiqueAPIDesignTool, CritiqueDynamicAPITool,DynamicSchemaDefinition
@@ -42,6 +46,144 @@ class TestCritiqueSearchToolCustomUnit:
         with pytest.raises(ValueError):
             tool._validate_image("not-base64-or-url")
 
+    def test_repeated_searches_hit_cache(self):
+        tool = CritiqueSearchTool(api_key="fake_key")
+        mock_session = MagicMock()
+        mock_session.post.return_value.content = orjson.dumps(
+            {"response": "cached", "citations": []}
+        )
+        tool._session = mock_session
+
+        params = {"prompt": "unique prompt for the cache test"}
+        first = tool.invoke(params)
+        second = tool.invoke(params)
+        assert first == second
+        assert mock_session.post.call_count == 1
+
+        uncached = CritiqueSearchTool(api_key="fake_key", cache=False)
+        uncached._session = mock_session
+        uncached.invoke(params)
+        assert mock_session.post.call_count == 2
+
+    def test_cache_is_scoped_per_api_key(self):
+        mock_session = MagicMock()
+        mock_session.post.return_value.content = orjson.dumps(
+            {"response": "per-key", "citations": []}
+        )
+        params = {"prompt": "per-key cache scoping"}
+
+        tool_a = CritiqueSearchTool(api_key="key_a")
+        tool_a._session = mock_session
+        tool_a.invoke(params)
+
+        # A second tool with different credentials must not be served the
+        # entry cached under the first key.
+        tool_b = CritiqueSearchTool(api_key="key_b")
+        tool_b._session = mock_session
+        tool_b.invoke(params)
+        assert mock_session.post.call_count == 2
+
+    def test_run_direct_skips_schema_validation(self):
+        tool = CritiqueSearchTool(api_key="fake_key", cache=False)
+        mock_session = MagicMock()
+        mock_session.post.return_value.content = orjson.dumps(
+            {"response": "direct", "citations": []}
+        )
+        tool._session = mock_session
+
+        result = tool.run_direct("a trusted caller's prompt")
+        assert result == {"response": "direct", "citations": []}
+        assert mock_session.post.call_count == 1
+
+    def test_with_default_concurrency_maps_over_list_configs(self):
+        from langchain_critique.tools import (
+            _DEFAULT_BATCH_CONCURRENCY,
+            _with_default_concurrency,
+        )
+
+        configs = _with_default_concurrency([{"tags": ["a"]}, {"max_concurrency": 2}])
+        assert configs[0] == {
+            "tags": ["a"],
+            "max_concurrency": _DEFAULT_BATCH_CONCURRENCY,
+        }
+        assert configs[1] == {"max_concurrency": 2}
+
+    def test_image_to_base64_detects_content_type(self):
+        tool = CritiqueSearchTool(api_key="fake_key")
+
+        png_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "application/octet-stream"}
+        mock_response.iter_content.return_value = iter([png_bytes])
+        mock_session = MagicMock()
+        mock_session.get.return_value = mock_response
+        tool._session = mock_session
+
+        data_uri = tool._image_to_base64("http://example.com/image.png")
+        expected_b64 = base64.b64encode(png_bytes).decode()
+        assert data_uri == f"data:image/png;base64,{expected_b64}"
+
+class TestCritiqueSearchToolAsyncUnit:
+    async def test_arun_posts_payload(self, monkeypatch):
+        import langchain_critique.tools as tools_module
+
+        tool = CritiqueSearchTool(api_key="fake_key")
+
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({"response": "ok", "citations": []})
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        monkeypatch.setattr(tools_module, "_get_async_client", lambda: mock_client)
+
+        result = await tool.ainvoke({"prompt": "What is Critique?"})
+        assert result == {"response": "ok", "citations": []}
+        assert mock_client.post.await_count == 1
+
+    async def test_concurrent_identical_requests_coalesce(self, monkeypatch):
+        import asyncio
+
+        import langchain_critique.tools as tools_module
+
+        tool = CritiqueSearchTool(api_key="fake_key", cache=False)
+
+        calls = 0
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({"response": "ok", "citations": []})
+
+        async def post(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_client = MagicMock()
+        mock_client.post = post
+        monkeypatch.setattr(tools_module, "_get_async_client", lambda: mock_client)
+
+        results = await asyncio.gather(
+            tool.ainvoke({"prompt": "the same sub-question"}),
+            tool.ainvoke({"prompt": "the same sub-question"}),
+        )
+        assert calls == 1
+        assert results[0] == results[1]
+
+    async def test_abatch_fans_out(self, monkeypatch):
+        import langchain_critique.tools as tools_module
+
+        tool = CritiqueSearchTool(api_key="fake_key", cache=False)
+
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({"response": "ok", "citations": []})
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        monkeypatch.setattr(tools_module, "_get_async_client", lambda: mock_client)
+
+        inputs = [{"prompt": f"question {i}"} for i in range(3)]
+        results = await tool.abatch(inputs)
+        assert len(results) == 3
+        assert mock_client.post.await_count == 3
+
+
 class TestCritiqueAPIDesignToolUnit(ToolsUnitTests):
     @property
     def tool_constructor(self) -> Type[CritiqueAPIDesignTool]:
@@ -102,14 +244,67 @@ class TestCritiqueDynamicAPIToolUnit:
         assert "company_name" in tool.args_schema.model_fields
         assert "metrics" in tool.args_schema.model_fields
         
-        # Test schema validation
+        # Test schema validation; stub out the HTTP session so no request is made
+        mock_session = MagicMock()
+        mock_session.post.return_value.content = orjson.dumps({"result": "success"})
+        tool._session = mock_session
+
         valid_input = {
             "company_name": "Test Corp",
             "metrics": ["environmental", "social"]
         }
         result = tool.invoke(valid_input)
         assert result["result"] == "success"
+        assert mock_session.post.call_count == 1
         
         # Test invalid input
         with pytest.raises(ValueError):
             tool.invoke({"company_name": "Test Corp"})  # Missing required metrics
+
+    def test_run_direct_uses_compiled_validator(self):
+        schema_definition = {
+            "company_name": DynamicSchemaDefinition(
+                type=str,
+                description="Name of the company"
+            )
+        }
+        tool = CritiqueDynamicAPITool(
+            api_id="test_api",
+            name="ESG Score API",
+            description="Get ESG scores for companies",
+            schema_definition=schema_definition,
+            api_key="fake_key",
+            cache=False,
+        )
+        mock_session = MagicMock()
+        mock_session.post.return_value.content = orjson.dumps({"result": "success"})
+        tool._session = mock_session
+
+        result = tool.run_direct(company_name="Test Corp")
+        assert result["result"] == "success"
+        assert mock_session.post.call_count == 1
+
+        with pytest.raises(ValueError, match="Missing required parameter"):
+            tool.run_direct()
+        with pytest.raises(ValueError, match="must be of type"):
+            tool.run_direct(company_name=123)
+
+    def test_identical_schemas_share_args_schema(self):
+        schema_definition = {
+            "ticker": DynamicSchemaDefinition(
+                type=str,
+                description="Stock ticker symbol"
+            )
+        }
+
+        tools = [
+            CritiqueDynamicAPITool(
+                api_id=f"api_{i}",
+                name=f"API {i}",
+                description="Shared input shape",
+                schema_definition=schema_definition,
+                api_key="fake_key",
+            )
+            for i in range(2)
+        ]
+        assert tools[0].args_schema is tools[1].args_schema